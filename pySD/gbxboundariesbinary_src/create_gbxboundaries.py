@@ -127,7 +127,7 @@ def dimless_gridboxboundaries(zgrid, xgrid, ygrid, COORD0):
 
 
 def set_arraydtype(arr, dtype):
-    og = type(arr[0])
+    og = np.asarray(arr).dtype
     if og != dtype:
         arr = np.array(arr, dtype=dtype)
 
@@ -140,7 +140,7 @@ def set_arraydtype(arr, dtype):
         )
         raise ValueError(warning)
 
-    return list(arr)
+    return np.ascontiguousarray(arr)
 
 
 def ctype_compatible_gridboxboundaries(ndims, idxs, bounds):
@@ -153,7 +153,7 @@ def ctype_compatible_gridboxboundaries(ndims, idxs, bounds):
     idxs = set_arraydtype(idxs, datatypes[1])
     bounds = set_arraydtype(bounds, datatypes[2])
 
-    datalist = ndims + idxs + bounds
+    datalist = [ndims, idxs, bounds]
 
     return datalist, datatypes
 
@@ -161,7 +161,7 @@ def create_allsuperdropattrs(nsupersdict, initattrsgen, gbxbounds, inputs, NUMCO
 
 
 def set_arraydtype(arr, dtype):
-    og = type(arr[0])
+    og = np.asarray(arr).dtype
     if og != dtype:
         arr = np.array(arr, dtype=dtype)
 
@@ -174,38 +174,29 @@ def set_arraydtype(arr, dtype):
         )
         raise ValueError(warning)
 
-    return arr
+    return np.ascontiguousarray(arr)
 
 
 def ctype_compatible_attrs(attrs):
-    """make list from arrays of SD attributes that are
+    """make list of arrays of SD attributes that are
     compatible with c type expected by SDM e.g. unsigned
     long ints for xi, doubles for radius and msol"""
 
     datatypes = [np.uintc, np.uint, np.double, np.double]
     datatypes += [np.double] * 3  # coords datatype
 
-    attrs.sdgbxindex = list(set_arraydtype(attrs.sdgbxindex, datatypes[0]))
-    attrs.xi = list(set_arraydtype(attrs.xi, datatypes[1]))
-    attrs.radius = list(set_arraydtype(attrs.radius, datatypes[2]))
-    attrs.msol = list(set_arraydtype(attrs.msol, datatypes[3]))
+    attrs.sdgbxindex = set_arraydtype(attrs.sdgbxindex, datatypes[0])
+    attrs.xi = set_arraydtype(attrs.xi, datatypes[1])
+    attrs.radius = set_arraydtype(attrs.radius, datatypes[2])
+    attrs.msol = set_arraydtype(attrs.msol, datatypes[3])
 
-    datalist = attrs.sdgbxindex + attrs.xi + attrs.radius + attrs.msol
+    datalist = [attrs.sdgbxindex, attrs.xi, attrs.radius, attrs.msol]
 
-    if any(attrs.coord3):
-        # make coord3 compatible if there is data for it (>= 1-D model)
-        attrs.coord3 = list(set_arraydtype(attrs.coord3, datatypes[4]))
-        datalist += attrs.coord3
-
-        if any(attrs.coord1):
-            # make coord1 compatible if there is data for it and coord3 (>= 2-D model)
-            attrs.coord1 = list(set_arraydtype(attrs.coord1, datatypes[4]))
-            datalist += attrs.coord1
-
-            if any(attrs.coord2):
-                # make coord2 compatible if there is data for it and coord3 and coord2 (>= 3-D model)
-                attrs.coord2 = list(set_arraydtype(attrs.coord2, datatypes[4]))
-                datalist += attrs.coord2
+    # (empty) coords are made compatible even if there is no data for them
+    attrs.coord3 = set_arraydtype(attrs.coord3, datatypes[4])
+    attrs.coord1 = set_arraydtype(attrs.coord1, datatypes[5])
+    attrs.coord2 = set_arraydtype(attrs.coord2, datatypes[6])
+    datalist += [attrs.coord3, attrs.coord1, attrs.coord2]
 
     return datalist, datatypes
 
@@ -224,10 +215,10 @@ def check_datashape(data, ndata, nspacedims):
             + "\n---------------------\n"
         )
 
-    if len(data) != np.sum(ndata):
+    if sum([d.size for d in data]) != np.sum(ndata):
         err += (
             "inconsistent dimensions of data: "
-            + str(np.shape(data))
+            + str([d.size for d in data])
             + ", and"
             + " data per attribute: "
             + str(ndata)
@@ -23,28 +23,36 @@ import numpy as np
 import xarray as xr
 
 
+def divide_where_nonzero(numerator, denominator):
+    """returns numerator / denominator in one pass into a preallocated
+    array, with result equal to zero wherever the denominator is zero"""
+    dtype = np.result_type(numerator, denominator, 1.0)  # same as true division
+    result = np.zeros(np.broadcast(numerator, denominator).shape, dtype=dtype)
+    np.divide(numerator, denominator, out=result, where=(denominator != 0))
+    return result
+
+
 class MassMoms:
+    """mass moments from zarr dataset. Data is read from the dataset lazily,
+    i.e. only on first access of a moment (either by key or attribute),
+    and then cached so that every access returns the same numpy array"""
+
     def __init__(self, dataset, ntime, ndims, lab=""):
         ds = self.tryopen_dataset(dataset)
         reshape = [ntime] + list(ndims)
 
+        self._lazy = {}
         try:
-            self.nsupers = self.var4d_fromzarr(
+            self._lazy["nsupers"] = self.var4d_fromzarr(
                 ds, reshape, "n" + lab + "supers"
-            )  # number of superdroplets in gbxs over time
+            )
         except KeyError:
-            self.nsupers = np.array([])
-
-        self.mom0 = self.var4d_fromzarr(
-            ds, reshape, "massmom0" + lab
-        )  # number of droplets in gbxs over time
-        self.mom1 = self.var4d_fromzarr(
-            ds, reshape, "massmom1" + lab
-        )  # total mass of droplets in gbxs over time
-        self.mom2 = self.var4d_fromzarr(
-            ds, reshape, "massmom2" + lab
-        )  # 2nd mass moment of droplets (~reflectivity)
-        self.effmass = self.effective_mass()
+            self._lazy["nsupers"] = np.array([])
+        self._lazy["mom0"] = self.var4d_fromzarr(ds, reshape, "massmom0" + lab)
+        self._lazy["mom1"] = self.var4d_fromzarr(ds, reshape, "massmom1" + lab)
+        self._lazy["mom2"] = self.var4d_fromzarr(ds, reshape, "massmom2" + lab)
+
+        self._lookup = {}  # numpy arrays of moments already read from dataset
 
         self.mom1_units = ds["massmom1"].units  # probably grams
         self.mom2_units = ds["massmom2"].units  # probably grams^2
@@ -52,34 +60,70 @@ class MassMoms:
             ds["massmom2"].units + "/" + ds["massmom1"].units
         )  # probably grams
 
+    @property
+    def nsupers(self):
+        """number of superdroplets in gbxs over time"""
+        return self["nsupers"]
+
+    @property
+    def mom0(self):
+        """number of droplets in gbxs over time"""
+        return self["mom0"]
+
+    @property
+    def mom1(self):
+        """total mass of droplets in gbxs over time"""
+        return self["mom1"]
+
+    @property
+    def mom2(self):
+        """2nd mass moment of droplets (~reflectivity)"""
+        return self["mom2"]
+
+    @property
+    def effmass(self):
+        """effective mass of droplets in gbxs over time"""
+        return self["effmass"]
+
     def tryopen_dataset(self, dataset):
         if isinstance(dataset, str):
             print("mass moments dataset: ", dataset)
-            return xr.open_dataset(dataset, engine="zarr", consolidated=False)
+            kwargs = dict(engine="zarr", chunks={}, decode_times=False)
+            try:
+                return xr.open_dataset(dataset, consolidated=True, **kwargs)
+            except (KeyError, FileNotFoundError, ValueError):
+                # dataset has no consolidated metadata (.zmetadata)
+                return xr.open_dataset(dataset, consolidated=False, **kwargs)
         else:
             return dataset
 
     def var4d_fromzarr(self, ds, reshape, key):
         """' returns 4D variable with dims
-        [time, y, x, z] from zarr dataset "ds" """
+        [time, y, x, z] from zarr dataset "ds". If "ds" is
+        chunked (see tryopen_dataset) the returned dask array is
+        lazy, i.e. data is only read from the zarr store when computed"""
 
-        return np.reshape(ds[key].values, reshape)
+        return ds[key].data.reshape(reshape)
 
     def effective_mass(self):
-        """effective mass of droplets"""
-        return self.mom2 / self.mom1
+        """effective mass of droplets (zero in gridboxes without droplets)"""
+        return divide_where_nonzero(self.mom2, self.mom1)
 
-    def __getitem__(self, key):
-        if key == "nsupers":
-            return self.nsupers
-        elif key == "mom0":
-            return self.mom0
-        elif key == "mom1":
-            return self.mom1
-        elif key == "mom2":
-            return self.mom2
+    def compute(self, key):
+        """read data for mass moment 'key' from dataset
+        and cache it as numpy array in lookup"""
+        if key in self._lazy:
+            self._lookup[key] = np.asarray(self._lazy[key])
         elif key == "effmass":
-            return self.effmass
+            self._lookup[key] = self.effective_mass()
         else:
             err = "no known return provided for " + key + " key"
             raise ValueError(err)
+
+    def __getitem__(self, key):
+        """returns numpy array for mass moment 'key'"""
+        try:
+            return self._lookup[key]
+        except KeyError:
+            self.compute(key)
+            return self._lookup[key]
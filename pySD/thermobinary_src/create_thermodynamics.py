@@ -18,18 +18,59 @@ File Description:
 """
 
 
+import inspect
 import numpy as np
+import os
+from functools import lru_cache, wraps
 from os.path import isfile
+from types import MappingProxyType
 from .. import cxx2py, readconfigfile, writebinary
 from ..gbxboundariesbinary_src.read_gbxboundaries import (
     read_dimless_gbxboundaries_binary,
 )
 
+# thermodynamic variables in the (fixed) order they are processed and written,
+# first those defined at gridbox centres and then the wind velocities at faces
+CENVARS = ("press", "temp", "qvap", "qcond")
+FACEVARS = ("wvel", "uvel", "vvel")
+THERMOVARS = CENVARS + FACEVARS
+ISCENVAR = np.array([True] * len(CENVARS) + [False] * len(FACEVARS))
 
+
+def cache_until_modified(nfiles, maxsize):
+    """decorator to cache results of a function whose first 'nfiles'
+    arguments are filenames. The files' modification times are part of
+    the cache's key so results are recomputed once any file changes"""
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @lru_cache(maxsize=maxsize)
+        def cached_func(mtimes, args):
+            return func(*args)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # positional and keyword calls are bound to the same key
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            args = tuple(bound.arguments.values())
+            mtimes = tuple(os.stat(f).st_mtime_ns for f in args[:nfiles])
+            return cached_func(mtimes, args)
+
+        wrapper.cache_info = cached_func.cache_info
+        wrapper.cache_clear = cached_func.cache_clear
+        return wrapper
+
+    return decorator
+
+
+@cache_until_modified(nfiles=2, maxsize=16)
 def thermoinputsdict(configfile, constsfile):
     """create values from constants file & config file
     required as inputs to create initial
-    superdroplet conditions"""
+    superdroplet conditions. Returned dict is read-only
+    since it is shared between calls (see cache_until_modified)"""
 
     consts = cxx2py.read_cxxconsts_into_floats(constsfile)
     mconsts = cxx2py.derive_more_floats(consts)
@@ -58,7 +99,22 @@ def thermoinputsdict(configfile, constsfile):
 
     inputs["ntime"] = int(np.ceil(inputs["T_END"] / inputs["COUPLTSTEP"])) + 1
 
-    return inputs
+    return MappingProxyType(inputs)
+
+
+@cache_until_modified(nfiles=1, maxsize=4)
+def cached_dimless_gbxboundaries(gridfile, COORD0):
+    """dimensionless gridbox boundaries (and ndims) from gridfile,
+    with arrays made read-only so repeated reads can share them"""
+
+    gbxbounds, ndims = read_dimless_gbxboundaries_binary(
+        gridfile, COORD0=COORD0, return_ndims=True, isprint=False
+    )
+    for bounds in gbxbounds.values():
+        bounds.setflags(write=False)
+    ndims.setflags(write=False)
+
+    return MappingProxyType(gbxbounds), ndims
 
 
 class DimlessThermodynamics:
@@ -73,73 +129,70 @@ class DimlessThermodynamics:
         self.qcond0 = 1.0
         self.VEL0 = inputs["W0"]
 
+        # scale factors of variables defined at gridbox centres (see CENVARS)
+        self._censcales = np.array(
+            [self.PRESS0, self.TEMP0, self.qvap0, self.qcond0], dtype=np.float64
+        )
+
+    def _censcales_for(self, cens):
+        """returns scale factors of centre variables broadcastable
+        against stacked array of them, 'cens'"""
+        return self._censcales.reshape((-1,) + (1,) * (cens.ndim - 1))
+
     def makedimless(self, THERMO):
-        thermodata = {
-            "press": THERMO["PRESS"] / self.PRESS0,
-            "temp": THERMO["TEMP"] / self.TEMP0,
-            "qvap": THERMO["qvap"],
-            "qcond": THERMO["qcond"],
-            "wvel": THERMO["WVEL"] / self.VEL0,
-            "uvel": THERMO["UVEL"] / self.VEL0,
-            "vvel": THERMO["VVEL"] / self.VEL0,
-        }
-
-        sfs = [self.PRESS0, self.TEMP0, 1.0, 1.0]
-        sfs += [self.VEL0] * 3
+        # variables at gridbox centres share a shape so can be scaled in one pass
+        cens = np.stack(
+            [THERMO["PRESS"], THERMO["TEMP"], THERMO["qvap"], THERMO["qcond"]]
+        )
+        cens = np.asarray(cens, dtype=np.float64)
+        cens /= self._censcales_for(cens)
+
+        thermodata = dict(zip(CENVARS, cens))
+        for var in FACEVARS:
+            thermodata[var] = np.divide(THERMO[var.upper()], self.VEL0)
+
+        sfs = list(self._censcales)
+        sfs += [self.VEL0] * len(FACEVARS)
 
         return thermodata, sfs
 
     def redimensionalise(self, thermo):
-        THERMODATA = {
-            "press": thermo["press"] * self.PRESS0,
-            "temp": thermo["temp"] * self.TEMP0,
-            "qvap": thermo["qvap"],
-            "qcond": thermo["qcond"],
-        }
-        if "wvel" in thermo.keys():
-            THERMODATA["wvel"] = thermo["wvel"] * self.VEL0
-        if "uvel" in thermo.keys():
-            THERMODATA["uvel"] = thermo["uvel"] * self.VEL0
-        if "vvel" in thermo.keys():
-            THERMODATA["vvel"] = thermo["vvel"] * self.VEL0
+        cens = np.stack([thermo[var] for var in CENVARS])
+        cens = np.asarray(cens, dtype=np.float64)
+        cens *= self._censcales_for(cens)
+
+        THERMODATA = dict(zip(CENVARS, cens))
+        for var in FACEVARS:
+            if var in thermo.keys():
+                THERMODATA[var] = np.multiply(thermo[var], self.VEL0)
 
         return THERMODATA
 
 
 def set_arraydtype(arr, dtype):
-    if any(arr):
-        og = type(arr[0])
-        if og != dtype:
-            arr = np.array(arr, dtype=dtype)
-
-            warning = (
-                "WARNING! dtype of attributes is being changed!"
-                + " from "
-                + str(og)
-                + " to "
-                + str(dtype)
-            )
-            raise ValueError(warning)
-
-    return list(arr)
+    """returns arr as contiguous numpy array of type dtype
+    (without copying if it already is one)"""
+    return np.ascontiguousarray(arr, dtype=dtype)
 
 
 def ctype_compatible_thermodynamics(thermodata):
-    """check type of gridbox boundaries data is compatible
-    with c type double. If not, change type and raise error"""
+    """return thermodynamics data as contiguous arrays (in
+    order of THERMOVARS) with type compatible with c type double"""
 
-    datatypes = [np.double] * 7
+    datatypes = [np.double] * len(THERMOVARS)
 
-    for k, key in enumerate(thermodata.keys()):
-        thermodata[key] = set_arraydtype(thermodata[key], datatypes[k])
+    thermodata = {
+        var: set_arraydtype(thermodata[var], dtype)
+        for var, dtype in zip(THERMOVARS, datatypes)
+    }
 
     return thermodata, datatypes
 
 
-def check_datashape(thermodata, ndata, ndims, ntime):
-    """make sure each superdroplet attribute in data has length stated
-    in ndata and that this length is compatible with the nummber of
-    attributes and superdroplets expected given ndata"""
+def check_datashape(thermodata, ndims, ntime):
+    """make sure each thermodynamic variable in data has the length
+    expected for data defined at gridbox centres or faces (winds may
+    also be empty) given the grid dimensions and number of timesteps"""
 
     # expected lengths of data defined on gridbox centres or faces
     cen = int(ntime * np.prod(ndims))
@@ -147,45 +200,29 @@ def check_datashape(thermodata, ndata, ndims, ntime):
     xface = int(ntime * ndims[2] * (ndims[1] + 1) * ndims[0])
     yface = int(ntime * (ndims[2] + 1) * ndims[1] * ndims[0])
 
-    vars = ["press", "temp", "qvap", "qcond"]
-    for var in vars:
-        lenvar = len(thermodata[var])
-        if lenvar != cen:
-            err = (
-                "\n------ ERROR! -----\n"
-                + str(lenvar)
-                + " "
-                + var
-                + " in thermodynamics data is not the"
-                + " expected length: ntimesteps*ngridboxes = "
-                + str(cen)
-                + "\n---------------------\n"
-            )
-            raise ValueError(err)
-
-    vars = ["wvel", "uvel", "vvel"]
-    for var, face in zip(vars, [zface, xface, yface]):
-        lenvar = len(thermodata[var])
-        if np.logical_and(lenvar, lenvar != face):
-            err = (
-                "\n------ ERROR! -----\n"
-                + str(lenvar)
-                + " "
-                + var
-                + " in thermodynamics data is not the"
-                + " expected length: ntimesteps*nfaces = "
-                + str(face)
-                + "\n---------------------\n"
-            )
-            raise ValueError(err)
+    expected = np.array([cen] * len(CENVARS) + [zface, xface, yface], dtype=np.int64)
 
-    lens = [len(d) for d in thermodata.values()]
-    if lens != ndata:
+    lens = np.fromiter(
+        (np.size(thermodata[var]) for var in THERMOVARS),
+        dtype=np.int64,
+        count=len(THERMOVARS),
+    )
+    # centre variables must have expected length, face variables may be empty
+    isbad = (lens != expected) & (ISCENVAR | (lens != 0))
+    if isbad.any():
+        v = int(np.argmax(isbad))
+        where = "ntimesteps*ngridboxes" if ISCENVAR[v] else "ntimesteps*nfaces"
         err = (
-            "inconsistent dimensions of thermodynamic data: "
-            + str(lens)
-            + " compared with given lengths: "
-            + str(ndata)
+            "\n------ ERROR! -----\n"
+            + str(lens[v])
+            + " "
+            + THERMOVARS[v]
+            + " in thermodynamics data is not the"
+            + " expected length: "
+            + where
+            + " = "
+            + str(expected[v])
+            + "\n---------------------\n"
         )
         raise ValueError(err)
 
@@ -204,49 +241,35 @@ def write_thermodynamics_binary(
         raise ValueError(errmsg)
 
     inputs = thermoinputsdict(configfile, constsfile)
-    gbxbounds, ndims = read_dimless_gbxboundaries_binary(
-        gridfile, COORD0=inputs["COORD0"], return_ndims=True, isprint=False
-    )
+    gbxbounds, ndims = cached_dimless_gbxboundaries(gridfile, COORD0=inputs["COORD0"])
     thermodata = thermogen.generate_thermo(gbxbounds, ndims, inputs["ntime"])
 
     dth = DimlessThermodynamics(inputs=inputs)
     thermodata, scale_factors = dth.makedimless(thermodata)
 
-    ndata = [len(dt) for dt in thermodata.values()]
-
     thermodata, datatypes = ctype_compatible_thermodynamics(thermodata)
-    check_datashape(thermodata, ndata, ndims, inputs["ntime"])
+    ndata = [thermodata[var].size for var in THERMOVARS]
+    check_datashape(thermodata, ndims, inputs["ntime"])
 
     units = [b"P", b"K", b" ", b" "]
-    units += [b"m"] * 3  # velocity units
+    units += [b"m"] * len(FACEVARS)  # velocity units
     scale_factors = np.asarray(scale_factors, dtype=np.double)
 
     idot = [i for i, ltr in enumerate(thermofile) if ltr == "."][-1]
     filestem, filetype = thermofile[:idot], thermofile[idot:]
-    varat = ["centres"] * 4 + ["z-faces", "x-faces", "y-faces"]
-    for v, var in enumerate(thermodata.keys()):
-        if thermodata[var] != []:
-            metastr = (
-                "This file is flattened array of "
-                + var
-                + " variable"
-                + " for "
-                + str(inputs["ntime"])
-                + " timesteps defined at"
-                + " grid "
-                + varat[v]
-                + " for grid with dims: "
-                + str(ndims)
-                + " (ie. file contains "
-                + str(ndata[v])
-                + " datapoints"
-                + " for "
-                + var
-                + " defined at gridbox "
-                + varat[v]
-                + " over "
-                + str(inputs["ntime"])
-                + " time steps)"
+    varat = ["centres"] * len(CENVARS) + ["z-faces", "x-faces", "y-faces"]
+
+    metastr_template = (
+        "This file is flattened array of {var} variable for {ntime} timesteps"
+        " defined at grid {varat} for grid with dims: {ndims} (ie. file contains"
+        " {n} datapoints for {var} defined at gridbox {varat} over {ntime} time"
+        " steps)"
+    )
+
+    for v, var in enumerate(THERMOVARS):
+        if ndata[v]:
+            metastr = metastr_template.format(
+                var=var, varat=varat[v], n=ndata[v], ntime=inputs["ntime"], ndims=ndims
             )
             filename = filestem + "_" + var + filetype
             writebinary.writebinary(
@@ -29,7 +29,12 @@ def writebinary(filename, data, ndata, datatypes, units, scale_factors, metastr)
     'ndata', likewise it's datatype, unit and scale_factor are in
     those lists. 'data' is written to binary file with this metadata
     beforehand and a global metadata string explaingnig how to interpret
-    the file"""
+    the file. 'data' may also be a numpy array (of a single datatype),
+    or a list of numpy arrays (one for each variable in 'ndata'), in
+    which case it is written directly from the arrays' buffers"""
+
+    if isinstance(data, np.ndarray):
+        data = np.split(data, np.cumsum(ndata)[:-1])  # views of each variable
 
     check_validinputs(data, ndata, datatypes, units, scale_factors)
 
@@ -40,16 +45,36 @@ def writebinary(filename, data, ndata, datatypes, units, scale_factors, metastr)
     )
     metadata, metaformat = metamaker.get_metadata()
 
-    dataformat = get_dataformat(nvars, ndata, datatypes)
+    print("Writing gridbox boundaries binary file to:\n " + filename)
+    if isvararrays(data):
+        s = struct.pack(metaformat, *metadata)
+        f = open(filename, "wb")
+        f.write(s)
+        for vardata in data:
+            f.write(littleendian_array(vardata))
+        f.close()
+    else:
+        dataformat = get_dataformat(nvars, ndata, datatypes)
+
+        array2write = metadata + data
+        format = metaformat + dataformat
 
-    array2write = metadata + data
-    format = metaformat + dataformat
+        s = struct.pack(format, *array2write)
+        f = open(filename, "wb")
+        f.write(s)
+        f.close()
 
-    print("Writing gridbox boundaries binary file to:\n " + filename)
-    s = struct.pack(format, *array2write)
-    f = open(filename, "wb")
-    f.write(s)
-    f.close()
+
+def isvararrays(data):
+    """returns True if data is a list of numpy arrays (one for
+    each variable) rather than one continuous list of datapoints"""
+    return len(data) > 0 and isinstance(data[0], np.ndarray)
+
+
+def littleendian_array(data):
+    """returns contiguous view (or copy if necessary) of data with little
+    endian byte order, consistent with "<" format of python's struct module"""
+    return np.ascontiguousarray(data, dtype=data.dtype.newbyteorder("<"))
 
 
 def check_validinputs(data, ndata, datatypes, units, scale_factors):
@@ -64,6 +89,24 @@ def check_validinputs(data, ndata, datatypes, units, scale_factors):
         if not isinstance(u, bytes) or np.size(u) != 1:
             raise ValueError("type of units is not binary C type char")
 
+    if isvararrays(data):
+        if len(data) != len(ndata):
+            raise ValueError("number of arrays in data doesn't match ndata")
+        for vardata, n, datatype in zip(data, ndata, datatypes):
+            if vardata.dtype != datatype or vardata.size != n:
+                err = (
+                    "stated datatype "
+                    + str(datatype)
+                    + " and size "
+                    + str(n)
+                    + " don't match data array with dtype "
+                    + str(vardata.dtype)
+                    + " and size "
+                    + str(vardata.size)
+                )
+                raise ValueError(err)
+        return
+
     i = 0
     for j, n in enumerate(ndata):
         if any([type(d) != datatypes[j] for d in data[i : i + n]]):